@@ -1,9 +1,9 @@
 import logging
-import requests
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
 from utils.jobmato_tools import JobMatoToolsMixin
+from utils.http_session import get_session
 from utils.response_formatter import ResponseFormatter
 
 logger = logging.getLogger(__name__)
@@ -92,10 +92,11 @@ class BaseAgent(ABC, JobMatoToolsMixin):
             logger.info(f"🌐 Making API call to: {url}")
             logger.info(f"🔑 Using token: {token[:50]}..." if token else "❌ No token provided")
             
+            session = get_session()
             if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=params, timeout=30)
+                response = session.get(url, headers=headers, params=params, timeout=30)
             elif method.upper() == 'POST':
-                response = requests.post(url, headers=headers, json=data, params=params, timeout=30)
+                response = session.post(url, headers=headers, json=data, params=params, timeout=30)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 class GeneralChatAgent(BaseAgent):
     """Agent responsible for handling general chat conversations"""
     
-    UNREALISTIC_LOCATIONS = {"mars", "moon", "jupiter", "saturn", "venus", "pluto", "mercury", "neptune", "uranus", "andromeda", "milky way", "galaxy", "space", "sun"}
+    UNREALISTIC_LOCATIONS = frozenset({"mars", "moon", "jupiter", "saturn", "venus", "pluto", "mercury", "neptune", "uranus", "andromeda", "milky way", "galaxy", "space", "sun"})
     
     def __init__(self, memory_manager=None):
         super().__init__()
@@ -1,18 +1,223 @@
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from .base_agent import BaseAgent
 from utils.llm_client import LLMClient
+from utils.response_formatter import safe_get_string, safe_get_list
 import json
+import hashlib
+import re
+import asyncio
 import redis
 from config import config
 import os
+import copy
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+current_config = config[os.environ.get('FLASK_ENV', 'development')]
+
+# Words stripped from a query before looking for job-related terms
+_ACTION_WORDS = ('suggest', 'find', 'show me', 'search for', 'look for', 'get me', 'give me')
+
+_INTERNSHIP_KEYWORDS = (
+    'intern', 'internship', 'internships', 'trainee', 'graduate', 'student',
+    'summer intern', 'summer internship', 'summer internships',
+    'winter intern', 'winter internship', 'winter internships',
+)
+
+# Role keywords for fallback query parsing, in priority order:
+# (role, trigger keywords, params applied when the role wins)
+_FALLBACK_ROLES = (
+    ('android', ('android',), MappingProxyType({'job_title': 'Android Developer', 'skills': 'Android,Kotlin,Java'})),
+    ('flutter', ('flutter',), MappingProxyType({'job_title': 'Flutter Developer', 'skills': 'Flutter,Dart,Mobile Development'})),
+    ('ios', ('ios',), MappingProxyType({'job_title': 'iOS Developer', 'skills': 'iOS,Swift,Objective-C'})),
+    ('full_stack', ('full stack', 'fullstack'), MappingProxyType({'job_title': 'Full Stack Developer', 'skills': 'JavaScript,React,Node.js,MongoDB'})),
+    ('python', ('python',), MappingProxyType({'job_title': 'Python Developer', 'skills': 'Python'})),
+    ('java', ('java',), MappingProxyType({'job_title': 'Java Developer', 'skills': 'Java'})),
+    ('javascript', ('javascript', 'js'), MappingProxyType({'job_title': 'JavaScript Developer', 'skills': 'JavaScript'})),
+    ('react', ('react',), MappingProxyType({'job_title': 'React Developer', 'skills': 'React,JavaScript'})),
+    ('node', ('node',), MappingProxyType({'job_title': 'Node.js Developer', 'skills': 'Node.js,JavaScript'})),
+    ('data_science', ('data scien',), MappingProxyType({'job_title': 'Data Scientist', 'skills': 'Python,Machine Learning,Data Science'})),
+    ('devops', ('devops',), MappingProxyType({'job_title': 'DevOps Engineer', 'skills': 'DevOps,AWS,Docker,Kubernetes'})),
+    ('frontend', ('frontend', 'front-end'), MappingProxyType({'job_title': 'Frontend Developer', 'skills': 'HTML,CSS,JavaScript,React'})),
+    ('backend', ('backend', 'back-end'), MappingProxyType({'job_title': 'Backend Developer', 'skills': 'Node.js,Python,Java'})),
+)
+_ROLE_BY_KEYWORD = {keyword: role for role, keywords, _ in _FALLBACK_ROLES for keyword in keywords}
+
+# Role priority when normalising an internship job title (unlike the fallback
+# order above, 'flutter' and 'react' outrank the other roles)
+_ROLE_TITLES = {role: role_params['job_title'] for role, _, role_params in _FALLBACK_ROLES}
+_INTERNSHIP_TITLE_ROLES = tuple(
+    (role, _ROLE_TITLES[role])
+    for role in ('flutter', 'android', 'ios', 'react', 'python', 'java', 'javascript', 'node',
+                 'full_stack', 'frontend', 'backend', 'data_science', 'devops')
+)
+
+# Work mode keywords, in priority order
+_WORK_MODE_BY_KEYWORD = {'remote': 'remote', 'onsite': 'on-site', 'on-site': 'on-site', 'hybrid': 'hybrid'}
+_WORK_MODE_PRIORITY = ('remote', 'on-site', 'hybrid')
+
+_SENIORITY_KEYWORDS = ('senior', 'junior')
+
+def _keyword_alternation(keywords) -> str:
+    """Build a regex alternation that tries longer keywords first"""
+    return '|'.join(re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True))
+
+# Longest first, so 'internships' and 'summer internship' are removed whole
+# instead of leaving 'ships' or 'summer ship' behind
+_INTERNSHIP_KEYWORD_RE = re.compile(_keyword_alternation(_INTERNSHIP_KEYWORDS))
+
+# One scan finds every fallback keyword; the named group tells which category
+# matched and the lookahead reports overlapping hits (longest keyword first,
+# so 'javascript' is not also reported as 'java')
+_FALLBACK_KEYWORD_RE = re.compile(
+    f"(?=(?P<role>{_keyword_alternation(_ROLE_BY_KEYWORD)})"
+    f"|(?P<work_mode>{_keyword_alternation(_WORK_MODE_BY_KEYWORD)})"
+    f"|(?P<seniority>{_keyword_alternation(_SENIORITY_KEYWORDS)}))"
+)
+
+def _roles_for_keywords(keywords) -> set:
+    """Map matched role keywords to roles; 'javascript' rules out plain 'java'"""
+    roles = {_ROLE_BY_KEYWORD[keyword] for keyword in keywords}
+    if 'javascript' in keywords:
+        roles.discard('java')
+    return roles
+
+# Whitespace-separated words longer than 3 characters
+_MEANINGFUL_WORD_RE = re.compile(r'\S{4,}')
+
+# Decodes the JSON object embedded in an LLM reply without splitting it into lines
+_JSON_DECODER = json.JSONDecoder()
+
+# Compact encoder for cached search results; default=str covers dates from the API
+_JSON_CACHE_ENCODER = json.JSONEncoder(separators=(',', ':'), default=str)
+
+# Intent keywords for _enhance_search_params; no keyword is a prefix of one in
+# another group, so the overlapping scan reports every group present
+_INTENT_KEYWORDS = {
+    'internship': ('intern', 'internship', 'trainee', 'graduate'),
+    'remote': ('remote', 'work from home', 'wfh'),
+    'on_site': ('on-site', 'office', 'onsite'),
+    'hybrid': ('hybrid',),
+    'junior': ('junior', 'entry level', 'fresher', 'fresh graduate'),
+    'senior': ('senior', 'lead', 'principal'),
+    'mid_level': ('mid level', 'intermediate'),
+}
+_INTENT_KEYWORD_RE = re.compile('(?=' + '|'.join(
+    f'(?P<{intent}>{_keyword_alternation(keywords)})' for intent, keywords in _INTENT_KEYWORDS.items()
+) + ')')
+
+# Params that only control paging, not how specific a search is
+_PAGING_KEYS = frozenset(('limit', 'page'))
+
+# Languages that get the Hindi/Hinglish versions of canned replies
+_HINDI_LANGUAGES = frozenset(('hindi', 'hinglish'))
+
+# Filter shapes shared by every params builder, applied with dict.update()
+_INTERNSHIP_FILTER = MappingProxyType({'internship': True, 'job_type': 'internship'})
+_FULL_TIME_FILTER = MappingProxyType({'internship': False, 'job_type': 'full-time'})
+
+# Params carried over from the original search into the broader retry
+_BROADER_PRESERVED_KEYS = ('skills',)
+
+# Search-cache writes are fire-and-forget; a dedicated pool survives the
+# per-message asyncio.run() loops and never delays the search response
+_REDIS_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='redis-write')
+
+# Speculative broader searches run here so they overlap the blocking primary search
+_BROADER_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='broader-search')
+
+# Identical searches already in flight, keyed by (base_url, search cache key).
+# Each message runs in its own thread and event loop, so waiters share a
+# thread-safe Future rather than an asyncio one. Values are [future, waiter_count]
+_INFLIGHT_SEARCHES: Dict[Tuple[str, str], List[Any]] = {}
+_INFLIGHT_SEARCHES_LOCK = threading.Lock()
+
+# Validated LLM-suggested skills per normalised job title. LLMClient already
+# caches replies by exact prompt, but only its last 100 prompts across every
+# LLM use in the agent, keyed on the raw title and including replies that fail
+# validation here. This cache folds case/whitespace variants of a title
+# together, holds more titles, and only keeps answers that passed validation
+_TITLE_SKILLS_CACHE_SIZE = 1024
+_TITLE_SKILLS_CACHE: 'OrderedDict[str, str]' = OrderedDict()
+_TITLE_SKILLS_CACHE_LOCK = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client for the agent (its pool reconnects as needed)"""
+    redis_url = current_config.REDIS_URL
+    redis_ssl = current_config.REDIS_SSL
+    
+    if redis_ssl:
+        return redis.from_url(
+            redis_url,
+            decode_responses=True,
+            ssl=True,
+            ssl_cert_reqs=None
+        )
+    return redis.from_url(
+        redis_url,
+        decode_responses=True
+    )
+
+def _job_id(job: Dict[str, Any]) -> Any:
+    """Get a job's id from whichever id field the backend filled in"""
+    return job.get('_id') or job.get('id')
+
+def _search_cache_key(token: str, search_params: Dict[str, Any]) -> str:
+    """Build the Redis key for a job search from the caller's token and its normalised params"""
+    # Job search is an authenticated per-user call, so results are never shared between tokens
+    key_source = token + '\n' + json.dumps(search_params, sort_keys=True, default=str)
+    return f"job_search_cache:{hashlib.sha256(key_source.encode()).hexdigest()}"
+
+# Technical skills that indicate professional experience. Matched as plain
+# substrings ('java' also counts inside 'javascript'), so they are not folded
+# into one regex - an alternation reports a single keyword per position
+_SUBSTANTIAL_SKILLS = (
+    'java', 'kotlin', 'android', 'react', 'node.js', 'python', 'javascript', 'typescript',
+    'mongodb', 'mysql', 'aws', 'docker', 'kubernetes', 'git', 'spring', 'django', 'flask',
+    'express', 'angular', 'vue', 'php', 'c#', 'c++', 'go', 'rust', 'swift', 'objective-c',
+    'tensorflow', 'pytorch', 'machine learning', 'data science', 'devops', 'cloud',
+    'microservices', 'rest api', 'graphql', 'sql', 'nosql', 'redis', 'elasticsearch'
+)
+
+# Only presence matters here, so one precompiled search covers every indicator;
+# case-insensitive so profile/resume dumps need no lowercased copy
+_EXPERIENCE_INDICATOR_RE = re.compile(_keyword_alternation(
+    ('experience', 'senior', 'lead', 'architect', 'manager', 'developer', 'engineer')
+), re.IGNORECASE)
+
+def _find_substantial_skills(text: str) -> List[str]:
+    """List the substantial skills mentioned in already-lowercased text"""
+    return [skill for skill in _SUBSTANTIAL_SKILLS if skill in text]
+
+def _job_content_key(job: Dict[str, Any]) -> Any:
+    """Fingerprint a posting by title, company and location to catch re-listed duplicates"""
+    title = job.get('job_title') or job.get('title')
+    company = job.get('company')
+    if isinstance(company, dict):
+        company = company.get('name')
+    location = job.get('locations') or job.get('location')
+    if isinstance(location, list):
+        location = ', '.join(item for item in location if isinstance(item, str))
+    # Only compare postings with a plain-text title, company and location; a
+    # title alone is too weak a match, so those jobs are left to the id check
+    if not all(isinstance(field, str) and field.strip() for field in (title, company, location)):
+        return None
+    return (title.strip().lower(), company.strip().lower(), location.strip().lower())
+
 class JobSearchAgent(BaseAgent):
     """Agent responsible for handling job search requests"""
     
-    UNREALISTIC_LOCATIONS = {"mars", "moon", "jupiter", "saturn", "venus", "pluto", "mercury", "neptune", "uranus", "andromeda", "milky way", "galaxy", "space", "sun"}
+    _PAGE_LIMIT = 10  # Show 10 jobs per page
+    
+    UNREALISTIC_LOCATIONS = frozenset({"mars", "moon", "jupiter", "saturn", "venus", "pluto", "mercury", "neptune", "uranus", "andromeda", "milky way", "galaxy", "space", "sun"})
+    _UNREALISTIC_LOCATION_RE = re.compile(_keyword_alternation(UNREALISTIC_LOCATIONS))
     
     def __init__(self, memory_manager=None):
         super().__init__(memory_manager)
@@ -46,19 +251,23 @@ class JobSearchAgent(BaseAgent):
     async def search_jobs(self, routing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Search for jobs using JobMato Tools with enhanced fallback logic"""
         try:
-            token = routing_data.get('token', '')
-            base_url = routing_data.get('baseUrl', self.base_url)
-            session_id = routing_data.get('sessionId', 'default')
-            original_query = routing_data.get('originalQuery', '')
-            extracted_data = routing_data.get('extractedData', {})
-            conversation_context = routing_data.get('conversation_context', '')
+            routing_get = routing_data.get
+            token = routing_get('token', '')
+            base_url = routing_get('baseUrl', self.base_url)
+            session_id = routing_get('sessionId', 'default')
+            original_query = routing_get('originalQuery', '')
+            extracted_data = routing_get('extractedData', {})
+            # Callers can opt out of the broader-filter retry to save a backend round trip
+            retry_broader = routing_get('retryBroader', True)
+            search_query = routing_get('searchQuery') or original_query or 'default search'
+            language = extracted_data.get('language', 'english')
             
             # Log extracted data for debugging
-            logger.info(f"📊 Extracted data received: {extracted_data}")
+            logger.info("📊 Extracted data received: %s", extracted_data)
             
-            # Log conversation context for debugging
-            if conversation_context:
-                logger.info(f"📝 Using conversation context: {conversation_context[:200]}...")
+            # Log conversation context for debugging (not used by the search itself)
+            if logger.isEnabledFor(logging.DEBUG) and routing_get('conversation_context'):
+                logger.debug("📝 Using conversation context: %.200s...", routing_get('conversation_context'))
             
             # Add this helper at the top of the class
             extracted_location = extracted_data.get('location', '')
@@ -75,14 +284,24 @@ class JobSearchAgent(BaseAgent):
             # Build comprehensive search parameters
             search_params = await self._build_search_params(extracted_data, {}, {})
             
+            # Optionally start the broader search now so it overlaps the first attempt
+            broader_params = None
+            broader_future = None
+            if retry_broader and current_config.SPECULATIVE_BROADER_SEARCH:
+                broader_params = await self._build_broader_search_params(extracted_data, search_params)
+                broader_future = _BROADER_SEARCH_EXECUTOR.submit(
+                    self._search_jobs_cached_blocking, token, base_url, broader_params
+                )
+                logger.info("🔍 Started speculative broader search: %s", broader_params)
+            
             # First attempt with original parameters
-            logger.info(f"🔍 First attempt search params: {search_params}")
-            job_search_result = await self.search_jobs_tool(token, base_url, **search_params)
+            logger.info("🔍 First attempt search params: %s", search_params)
+            job_search_result = await self._search_jobs_cached(token, base_url, search_params)
+            response_time = job_search_result.get('response_time', 0)
             
             # Enhanced error handling with detailed API response analysis
             if not job_search_result.get('success'):
                 error_msg = job_search_result.get('error', 'Unknown error')
-                response_time = job_search_result.get('response_time', 0)
                 
                 if job_search_result.get('timeout'):
                     logger.error(f"⏰ API timeout after {response_time:.2f}s for query: {original_query}")
@@ -109,7 +328,7 @@ class JobSearchAgent(BaseAgent):
                     logger.error(f"❌ API error for query '{original_query}': {error_msg}")
                     return self._handle_search_failure(
                         original_query, 
-                        extracted_data.get('language', 'english'),
+                        language,
                         {
                             'error_type': 'api_error',
                             'original_error': error_msg,
@@ -119,33 +338,48 @@ class JobSearchAgent(BaseAgent):
             
             jobs_data = job_search_result.get('data', {})
             jobs = jobs_data.get('jobs', [])
-            response_time = job_search_result.get('response_time', 0)
             logger.info(f"⏱️ First search completed in {response_time:.2f}s")
             
-            # If less than 10 jobs found, try with broader filters (without job_title)
-            if len(jobs) < 10:
+            if not jobs and not retry_broader:
+                return self._handle_no_jobs_found(original_query, search_params, language, broader_search_attempted=False)
+            
+            # If less than a page of jobs found, try with broader filters (without job_title)
+            if len(jobs) < self._PAGE_LIMIT and retry_broader:
                 logger.info(f"🔄 Found only {len(jobs)} jobs, trying with broader filters (removing job_title)...")
-                broader_params = await self._build_broader_search_params(extracted_data, search_params)
-                logger.info(f"🔍 Broader search params: {broader_params}")
-                
-                broader_result = await self.search_jobs_tool(token, base_url, **broader_params)
+                if broader_future is not None:
+                    broader_result = await asyncio.wrap_future(broader_future)
+                else:
+                    broader_params = await self._build_broader_search_params(extracted_data, search_params)
+                    logger.info("🔍 Broader search params: %s", broader_params)
+                    broader_result = await self._search_jobs_cached(token, base_url, broader_params)
+                broader_response_time = broader_result.get('response_time', 0)
                 
                 if broader_result.get('success'):
                     broader_jobs_data = broader_result.get('data', {})
                     broader_jobs = broader_jobs_data.get('jobs', [])
-                    broader_response_time = broader_result.get('response_time', 0)
                     
                     if broader_jobs:
                         # Combine original jobs with broader search results, avoiding duplicates
                         original_job_count = len(jobs)
-                        original_job_ids = {job.get('_id') or job.get('id') for job in jobs if job.get('_id') or job.get('id')}
-                        unique_broader_jobs = [
-                            job for job in broader_jobs 
-                            if (job.get('_id') or job.get('id')) not in original_job_ids
-                        ]
+                        original_job_ids = {job_id for job_id in map(_job_id, jobs) if job_id}
+                        # The same posting can come back under a different id, so also compare content
+                        seen_job_content = {key for key in map(_job_content_key, jobs) if key}
+                        unique_broader_jobs = []
+                        for job in broader_jobs:
+                            if _job_id(job) in original_job_ids:
+                                continue
+                            content_key = _job_content_key(job)
+                            if content_key:
+                                if content_key in seen_job_content:
+                                    continue
+                                seen_job_content.add(content_key)
+                            unique_broader_jobs.append(job)
+                            # Stop scanning once the page is full
+                            if len(unique_broader_jobs) >= self._PAGE_LIMIT - original_job_count:
+                                break
                         
                         # Combine jobs (original first, then unique broader results)
-                        combined_jobs = jobs + unique_broader_jobs[:10-len(jobs)]  # Limit to 10 total
+                        combined_jobs = jobs + unique_broader_jobs  # Limit to one page total
                         jobs = combined_jobs
                         
                         # Update jobs_data with combined results
@@ -158,11 +392,10 @@ class JobSearchAgent(BaseAgent):
                     else:
                         logger.info(f"❌ No additional jobs found with broader filters ({broader_response_time:.2f}s)")
                         if len(jobs) == 0:
-                            return self._handle_no_jobs_found(original_query, search_params, extracted_data.get('language', 'english'))
+                            return self._handle_no_jobs_found(original_query, search_params, language)
                 else:
                     # Handle broader search errors too
                     broader_error = broader_result.get('error', 'Unknown error')
-                    broader_response_time = broader_result.get('response_time', 0)
                     
                     if broader_result.get('timeout'):
                         logger.error(f"⏰ Broader search also timed out after {broader_response_time:.2f}s")
@@ -186,7 +419,7 @@ class JobSearchAgent(BaseAgent):
                         logger.info(f"❌ Broader search also failed: {broader_error}")
                         return self._handle_search_failure(
                             original_query, 
-                            extracted_data.get('language', 'english'),
+                            language,
                             {
                                 'error_type': 'broader_search_failed',
                                 'original_error': broader_error,
@@ -194,25 +427,22 @@ class JobSearchAgent(BaseAgent):
                             }
                         )
             
-            # Format jobs for response (don't send raw data to AI)
-            formatted_jobs = []
-            for job in jobs:
-                formatted_job = self.format_job_for_response(job)
-                formatted_jobs.append(formatted_job)
+            elif broader_future is not None:
+                # First page is full - the speculative result is not needed
+                broader_future.cancel()
             
-            # Get total available jobs from API response first
-            total_available = jobs_data.get('total', len(formatted_jobs))
-            has_more = total_available > 10
+            # Format jobs for response (don't send raw data to AI), only as many as
+            # were requested in case the API returns a larger page
+            limit = search_params.get('limit')
+            if not isinstance(limit, int):
+                limit = self._PAGE_LIMIT
+            formatted_jobs = [self.format_job_for_response(job) for job in jobs[:limit]]
             
-            # Create dynamic 2-line message based on results
+            # Get total available jobs from API response first
             total_jobs = len(formatted_jobs)
-            search_query = routing_data.get('searchQuery') or routing_data.get('originalQuery', 'default search')
+            total_available = jobs_data.get('total', total_jobs)
+            has_more = total_available > self._PAGE_LIMIT
             
-            if total_jobs == 1:
-                content = f"Here's a job opportunity that matches your search for '{search_query}':"
-            else:
-                content = f"Here are {total_jobs} job opportunities that might interest you:"
-
             # Store search context for follow-up searches
             search_context = {
                 'skills': search_params.get('skills'),
@@ -228,34 +458,8 @@ class JobSearchAgent(BaseAgent):
                 'current_page': 1
             }
             
-            # Storage is handled by app.py to avoid duplication
-            
-            # Storage is handled by app.py to avoid duplication
-            
-            # Store current page in Redis for pagination tracking
-            try:
-                current_config = config[os.environ.get('FLASK_ENV', 'development')]
-                redis_url = current_config.REDIS_URL
-                redis_ssl = current_config.REDIS_SSL
-                
-                if redis_ssl:
-                    redis_client = redis.from_url(
-                        redis_url,
-                        decode_responses=True,
-                        ssl=True,
-                        ssl_cert_reqs=None
-                    )
-                else:
-                    redis_client = redis.from_url(
-                        redis_url,
-                        decode_responses=True
-                    )
-                
-                session_id = routing_data.get('sessionId', 'default')
-                redis_client.setex(f"last_page:{session_id}", 3600, "1")  # Store current page
-                logger.info(f"💾 Stored current page 1 for session {session_id}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not store current page: {str(e)}")
+            # Store current page in Redis before replying - app.py reads it to pick the "load more" page
+            self._store_current_page(session_id, 1)
 
             return self.response_formatter.format_job_response(
                 jobs=formatted_jobs,
@@ -281,66 +485,37 @@ class JobSearchAgent(BaseAgent):
         try:
             if isinstance(obj, dict):
                 value = obj.get(key, default)
-            elif hasattr(obj, key):
-                value = getattr(obj, key, default)
             else:
-                value = default
+                value = getattr(obj, key, default)
             
             # Handle nested objects and lists
-            if isinstance(value, (dict, list)):
-                if isinstance(value, dict):
-                    # For nested objects, try to get a meaningful string representation
-                    if 'name' in value:
-                        return str(value['name'])
-                    elif 'text' in value:
-                        return str(value['text'])
-                    else:
-                        return str(value)
-                elif isinstance(value, list):
-                    # For lists, join with commas
-                    return ', '.join(str(item) for item in value[:3])  # Limit to first 3 items
-            else:
-                return str(value) if value is not None else default
+            if isinstance(value, str):
+                return value
+            elif isinstance(value, dict):
+                # For nested objects, try to get a meaningful string representation
+                if 'name' in value:
+                    return str(value['name'])
+                elif 'text' in value:
+                    return str(value['text'])
+                return str(value)
+            elif isinstance(value, list):
+                # For lists, join with commas
+                return ', '.join(map(str, value[:3]))  # Limit to first 3 items
+            return str(value) if value is not None else default
         except Exception as e:
             logger.warning(f"⚠️ Error extracting {key} from {type(obj)}: {str(e)}")
             return default
 
     def format_job_for_response(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Format job data for response following the specified structure"""
-        
-        def safe_get_string(value, default=""):
-            """Safely extract string value from potentially complex objects"""
-            if isinstance(value, str):
-                return value
-            elif isinstance(value, dict):
-                # Try to get name or title from object
-                return value.get('name', value.get('title', value.get('display_name', default)))
-            elif isinstance(value, list):
-                # Join list items
-                return ', '.join([safe_get_string(item) for item in value])
-            elif value is None:
-                return default
-            else:
-                return str(value)
-        
-        def safe_get_list(value, default=None):
-            """Safely extract list value"""
-            if isinstance(value, list):
-                return value
-            elif isinstance(value, str):
-                return [value]
-            elif value is None:
-                return default or []
-            else:
-                return [str(value)]
-        
+        locations = job.get('locations')
         return {
             '_id': job.get('_id'),
             'job_id': job.get('job_id'),
             'job_title': safe_get_string(job.get('job_title'), 'Job Title'),
             'company': safe_get_string(job.get('company'), 'Company'),
-            'locations': safe_get_list(job.get('locations')),
-            'location': safe_get_string(job.get('locations', [])[0] if job.get('locations') else job.get('location'), 'Location'),
+            'locations': safe_get_list(locations),
+            'location': safe_get_string(locations[0] if locations else job.get('location'), 'Location'),
             'experience': safe_get_string(job.get('experience'), 'Experience'),
             'salary': safe_get_string(job.get('salary'), 'Salary'),
             'skills': safe_get_list(job.get('skills')),
@@ -357,7 +532,7 @@ class JobSearchAgent(BaseAgent):
         """Handle job search failure with detailed error information"""
         
         # Build user-friendly error message
-        if language in ['hindi', 'hinglish']:
+        if language in _HINDI_LANGUAGES:
             if error_details and error_details.get('error_type') == 'timeout':
                 content = f"Sorry yaar, '{original_query}' ke liye search slow ho raha hai! Database busy hai. Please thoda wait karo aur try again! ⏰"
             elif error_details and error_details.get('error_type') == 'connection_error':
@@ -384,10 +559,12 @@ class JobSearchAgent(BaseAgent):
             error_details=error_details or {'error_type': 'search_failed', 'query': original_query}
         )
     
-    def _handle_no_jobs_found(self, original_query: str, search_params: Dict[str, Any], language: str = 'english') -> Dict[str, Any]:
-        """Handle case when no jobs are found even after broader search"""
-        if language in ['hindi', 'hinglish']:
-            content = f"'{original_query}' ke liye koi jobs nahi mili, even after trying broader filters. Try these suggestions:\n\n"
+    def _handle_no_jobs_found(self, original_query: str, search_params: Dict[str, Any], language: str = 'english',
+                              broader_search_attempted: bool = True) -> Dict[str, Any]:
+        """Handle case when no jobs are found, with or without a broader retry"""
+        if language in _HINDI_LANGUAGES:
+            broader_note = ", even after trying broader filters" if broader_search_attempted else ""
+            content = f"'{original_query}' ke liye koi jobs nahi mili{broader_note}. Try these suggestions:\n\n"
             content += "🔍 **Search Tips:**\n"
             content += "• Use simpler keywords like 'developer' instead of 'React developer'\n"
             content += "• Remove location restrictions\n"
@@ -399,7 +576,8 @@ class JobSearchAgent(BaseAgent):
             content += "• 'tech jobs'\n"
             content += "• 'remote jobs'"
         else:
-            content = f"No jobs found for '{original_query}', even after trying broader filters. Here are some suggestions:\n\n"
+            broader_note = ", even after trying broader filters" if broader_search_attempted else ""
+            content = f"No jobs found for '{original_query}'{broader_note}. Here are some suggestions:\n\n"
             content += "🔍 **Search Tips:**\n"
             content += "• Use simpler keywords like 'developer' instead of 'React developer'\n"
             content += "• Remove location restrictions\n"
@@ -426,14 +604,14 @@ class JobSearchAgent(BaseAgent):
                     'Search for "IT jobs"',
                     'Search for "remote jobs"'
                 ],
-                'broaderSearchAttempted': True
+                'broaderSearchAttempted': broader_search_attempted
             }
         )
     
     async def _build_search_params(self, extracted_data: Dict[str, Any], profile_data: Dict[str, Any], resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Build comprehensive search parameters from extracted data using JobMato Tools"""
         params = {
-            'limit': 10,  # Show 10 jobs per page
+            'limit': self._PAGE_LIMIT,
             'page': 1
         }
         
@@ -446,7 +624,8 @@ class JobSearchAgent(BaseAgent):
             params['query'] = extracted_data['searchQuery']
         
         # Handle job_title or job_title_keywords
-        job_title = extracted_data.get('job_title') or extracted_data.get('job_title_keywords') or extracted_data.get('keywords')
+        raw_job_title = extracted_data.get('job_title')
+        job_title = raw_job_title or extracted_data.get('job_title_keywords') or extracted_data.get('keywords')
         if job_title:
             # Convert to string if it's a list
             if isinstance(job_title, list):
@@ -512,51 +691,48 @@ class JobSearchAgent(BaseAgent):
         is_internship_request = (
             extracted_data.get('internship') is True or 
             extracted_data.get('job_type') == 'internship' or
-            (extracted_data.get('job_title', '').lower().find('intern') != -1)
+            (isinstance(raw_job_title, str) and 'intern' in raw_job_title.lower())
         )
         
+        self._apply_internship_filter(params, extracted_data, is_internship_request, profile_data, resume_data)
+        
+        # 📄 Pagination parameters
+        if extracted_data.get('limit'):
+            params['limit'] = extracted_data['limit']
+        if extracted_data.get('page'):
+            params['page'] = extracted_data['page']
+        
+        logger.info("🔧 Built comprehensive search params: %s", params)
+        logger.info("📊 Input extracted_data was: %s", extracted_data)
+        return params
+    
+    def _apply_internship_filter(self, params: Dict[str, Any], extracted_data: Dict[str, Any], is_internship_request: bool,
+                                 profile_data: Dict[str, Any], resume_data: Dict[str, Any], log_prefix: str = '') -> None:
+        """Apply the internship/full-time filter shared by regular and broader searches"""
         if is_internship_request:
             # Always set internship=True when user explicitly requests internships
-            params['internship'] = True
-            params['job_type'] = 'internship'
+            params.update(_INTERNSHIP_FILTER)
             # Remove any experience parameters for internships
             params.pop('experience_min', None)
             params.pop('experience_max', None)
-            logger.info(f"🎓 Detected internship request - setting internship=True and removing experience filters")
+            logger.info(f"🎓 {log_prefix}Detected internship request - setting internship=True and removing experience filters")
         elif extracted_data.get('internship') is False:
             # User explicitly said no internships
-            params['internship'] = False
-            params['job_type'] = 'full-time'
-            logger.info(f"💼 User explicitly requested non-internship positions")
+            params.update(_FULL_TIME_FILTER)
+            logger.info(f"💼 {log_prefix}User explicitly requested non-internship positions")
+        elif self._has_substantial_technical_skills(extracted_data, profile_data, resume_data):
+            # No explicit internship request - default based on skills
+            params.update(_FULL_TIME_FILTER)
+            logger.info(f"💼 {log_prefix}Defaulting to full-time positions for user with substantial skills")
         else:
-            # No explicit internship request - check if we should default based on skills
-            has_substantial_skills = self._has_substantial_technical_skills(extracted_data, profile_data, resume_data)
-            if has_substantial_skills:
-                params['internship'] = False
-                params['job_type'] = 'full-time'
-                logger.info(f"💼 Defaulting to full-time positions for user with substantial skills")
             # If no substantial skills, don't set internship filter to allow both types
-        
-        # 📄 Pagination parameters
-        if extracted_data.get('limit'):
-            params['limit'] = extracted_data['limit']
-        if extracted_data.get('page'):
-            params['page'] = extracted_data['page']
-        
-        logger.info(f"🔧 Built comprehensive search params: {params}")
-        logger.info(f"📊 Input extracted_data was: {extracted_data}")
-        return params
+            logger.info(f"🎓 {log_prefix}Entry-level user - allowing both internship and full-time positions")
     
     def _has_substantial_technical_skills(self, extracted_data: Dict[str, Any], profile_data: Dict[str, Any], resume_data: Dict[str, Any]) -> bool:
         """Check if user has substantial technical skills that suggest they're beyond internship level"""
-        # Define substantial technical skills that indicate professional experience
-        substantial_skills = [
-            'java', 'kotlin', 'android', 'react', 'node.js', 'python', 'javascript', 'typescript',
-            'mongodb', 'mysql', 'aws', 'docker', 'kubernetes', 'git', 'spring', 'django', 'flask',
-            'express', 'angular', 'vue', 'php', 'c#', 'c++', 'go', 'rust', 'swift', 'objective-c',
-            'tensorflow', 'pytorch', 'machine learning', 'data science', 'devops', 'cloud',
-            'microservices', 'rest api', 'graphql', 'sql', 'nosql', 'redis', 'elasticsearch'
-        ]
+        # Profile and resume lookups that failed carry an 'error' key and are skipped
+        use_profile = bool(profile_data) and not profile_data.get('error')
+        use_resume = bool(resume_data) and not resume_data.get('error')
         
         # Check skills from extracted data
         skills_value = extracted_data.get('skills', '')
@@ -566,54 +742,49 @@ class JobSearchAgent(BaseAgent):
             skills_text = str(skills_value).lower()
         
         if skills_text:
-            found_skills = [skill for skill in substantial_skills if skill in skills_text]
+            found_skills = _find_substantial_skills(skills_text)
             if len(found_skills) >= 3:  # At least 3 substantial skills
                 logger.info(f"🎯 Found substantial skills in extracted data: {found_skills}")
                 return True
         
         # Check skills from profile data
-        if profile_data and not profile_data.get('error'):
+        if use_profile:
             profile_skills = str(profile_data.get('skills', '')).lower()
             if profile_skills:
-                found_skills = [skill for skill in substantial_skills if skill in profile_skills]
+                found_skills = _find_substantial_skills(profile_skills)
                 if len(found_skills) >= 3:
                     logger.info(f"🎯 Found substantial skills in profile data: {found_skills}")
                     return True
         
         # Check skills from resume data
-        if resume_data and not resume_data.get('error'):
+        if use_resume:
             resume_skills = str(resume_data.get('skills', '')).lower()
             if resume_skills:
-                found_skills = [skill for skill in substantial_skills if skill in resume_skills]
+                found_skills = _find_substantial_skills(resume_skills)
                 if len(found_skills) >= 3:
                     logger.info(f"🎯 Found substantial skills in resume data: {found_skills}")
                     return True
         
-        # Check for experience indicators
-        experience_indicators = ['experience', 'senior', 'lead', 'architect', 'manager', 'developer', 'engineer']
-        
-        # Check in extracted data
+        # Check for experience indicators in extracted data
         query_value = extracted_data.get('query', '')
         if isinstance(query_value, list):
             query_text = ' '.join(query_value).lower()
         else:
             query_text = str(query_value).lower()
 
-        if any(indicator in query_text for indicator in experience_indicators):
+        if _EXPERIENCE_INDICATOR_RE.search(query_text):
             logger.info(f"🎯 Found experience indicators in query: {query_text}")
             return True
         
         # Check in profile data
-        if profile_data and not profile_data.get('error'):
-            profile_text = str(profile_data).lower()
-            if any(indicator in profile_text for indicator in experience_indicators):
+        if use_profile:
+            if _EXPERIENCE_INDICATOR_RE.search(str(profile_data)):
                 logger.info(f"🎯 Found experience indicators in profile data")
                 return True
         
         # Check in resume data
-        if resume_data and not resume_data.get('error'):
-            resume_text = str(resume_data).lower()
-            if any(indicator in resume_text for indicator in experience_indicators):
+        if use_resume:
+            if _EXPERIENCE_INDICATOR_RE.search(str(resume_data)):
                 logger.info(f"🎯 Found experience indicators in resume data")
                 return True
         
@@ -622,15 +793,6 @@ class JobSearchAgent(BaseAgent):
     
     async def _enhance_skills_from_job_title(self, extracted_data: Dict[str, Any]) -> str:
         """Enhance skills using LLM if not provided by query classifier"""
-        # Handle different job title field names
-        job_title = extracted_data.get('job_title') or extracted_data.get('job_title_keywords', '') or extracted_data.get('keywords', '')
-        
-        # Convert job_title to string if it's a list
-        if isinstance(job_title, list):
-            job_title = ' '.join(job_title) if job_title else ''
-        
-        job_title = str(job_title).strip()
-        
         existing_skills = extracted_data.get('skills', '')
         
         # If skills are already provided by query classifier, use them
@@ -640,11 +802,29 @@ class JobSearchAgent(BaseAgent):
                 return ', '.join(existing_skills)
             return str(existing_skills)
         
+        # Handle different job title field names
+        job_title = extracted_data.get('job_title') or extracted_data.get('job_title_keywords', '') or extracted_data.get('keywords', '')
+        
+        # Convert job_title to string if it's a list
+        if isinstance(job_title, list):
+            job_title = ' '.join(job_title) if job_title else ''
+        
+        job_title = str(job_title).strip()
+        
         # If no skills and no job title, return empty
         if not job_title:
             logger.info(f"⚠️ No job title or skills provided for skill enhancement")
             return ""
         
+        title_key = ' '.join(job_title.lower().split())
+        with _TITLE_SKILLS_CACHE_LOCK:
+            cached_skills = _TITLE_SKILLS_CACHE.get(title_key)
+            if cached_skills is not None:
+                _TITLE_SKILLS_CACHE.move_to_end(title_key)
+        if cached_skills is not None:
+            logger.info(f"✅ Using cached skills for '{job_title}': {cached_skills}")
+            return cached_skills
+        
         # Use LLM to dynamically detect skills based on job title
         try:
             prompt = f"Extract the top 5-8 most relevant technical skills for a '{job_title}' position. Return only a comma-separated list of skills, no explanations."
@@ -659,6 +839,10 @@ class JobSearchAgent(BaseAgent):
             
             if skills and len(skills) > 5:  # Basic validation
                 logger.info(f"🎯 LLM-generated skills for '{job_title}': {skills}")
+                with _TITLE_SKILLS_CACHE_LOCK:
+                    _TITLE_SKILLS_CACHE[title_key] = skills
+                    if len(_TITLE_SKILLS_CACHE) > _TITLE_SKILLS_CACHE_SIZE:
+                        _TITLE_SKILLS_CACHE.popitem(last=False)
                 return skills
             else:
                 logger.warning(f"⚠️ LLM returned invalid skills for '{job_title}': {response}")
@@ -674,9 +858,9 @@ class JobSearchAgent(BaseAgent):
         
         # Auto-detect internship based on query keywords
         original_query = routing_data.get('originalQuery', '').lower()
-        if any(keyword in original_query for keyword in ['intern', 'internship', 'trainee', 'graduate']):
-            params['internship'] = True
-            params['job_type'] = 'internship'
+        intents = {match.lastgroup for match in _INTENT_KEYWORD_RE.finditer(original_query)}
+        if 'internship' in intents:
+            params.update(_INTERNSHIP_FILTER)
             # Remove any experience parameters for internships
             params.pop('experience_min', None)
             params.pop('experience_max', None)
@@ -686,25 +870,25 @@ class JobSearchAgent(BaseAgent):
                 params = self._clean_internship_job_title(params)
         
         # Auto-detect remote work preference
-        if any(keyword in original_query for keyword in ['remote', 'work from home', 'wfh']):
+        if 'remote' in intents:
             params['work_mode'] = 'remote'
-        elif any(keyword in original_query for keyword in ['on-site', 'office', 'onsite']):
+        elif 'on_site' in intents:
             params['work_mode'] = 'on-site'
-        elif any(keyword in original_query for keyword in ['hybrid']):
+        elif 'hybrid' in intents:
             params['work_mode'] = 'hybrid'
         
         # Auto-detect experience level
-        if any(keyword in original_query for keyword in ['junior', 'entry level', 'fresher', 'fresh graduate']):
+        if 'junior' in intents:
             params['experience_min'] = "0"
             params['experience_max'] = "2"
-        elif any(keyword in original_query for keyword in ['senior', 'lead', 'principal']):
+        elif 'senior' in intents:
             params['experience_min'] = "5"
-        elif any(keyword in original_query for keyword in ['mid level', 'intermediate']):
+        elif 'mid_level' in intents:
             params['experience_min'] = "2"
             params['experience_max'] = "5"
         
         # Optimize limit based on search specificity
-        if len([k for k in params.keys() if params[k] and k not in ['limit', 'page']]) > 5:
+        if sum(1 for key, value in params.items() if value and key not in _PAGING_KEYS) > 5:
             # Very specific search, increase limit
             params['limit'] = 25
         
@@ -712,7 +896,9 @@ class JobSearchAgent(BaseAgent):
     
     def _format_job_response(self, job_data: Dict[str, Any], routing_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format job search response"""
-        logger.info(f"🔍 Formatting job response with data: {job_data}")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"🔍 Formatting job response with data: {job_data}")
         
         if job_data.get('error'):
             logger.error(f"❌ Job data contains error: {job_data['error']}")
@@ -723,8 +909,9 @@ class JobSearchAgent(BaseAgent):
             )
         
         # Debug: Log the entire job_data structure
-        logger.info(f"📊 Job data keys: {list(job_data.keys()) if isinstance(job_data, dict) else 'Not a dict'}")
-        logger.info(f"📊 Job data type: {type(job_data)}")
+        if debug_enabled:
+            logger.debug(f"📊 Job data keys: {list(job_data.keys()) if isinstance(job_data, dict) else 'Not a dict'}")
+            logger.debug(f"📊 Job data type: {type(job_data)}")
         
         # Handle different possible response structures
         jobs = []
@@ -737,8 +924,9 @@ class JobSearchAgent(BaseAgent):
         elif isinstance(job_data, list):
             jobs = job_data
         
-        logger.info(f"📋 Extracted jobs: {len(jobs) if isinstance(jobs, list) else 'Not a list'}")
-        logger.info(f"📋 Jobs type: {type(jobs)}")
+        if debug_enabled:
+            logger.debug(f"📋 Extracted jobs: {len(jobs) if isinstance(jobs, list) else 'Not a list'}")
+            logger.debug(f"📋 Jobs type: {type(jobs)}")
         
         # If jobs is still not a list, log the structure and create empty list
         if not isinstance(jobs, list):
@@ -749,20 +937,21 @@ class JobSearchAgent(BaseAgent):
         # Format individual jobs
         formatted_jobs = []
         if jobs:
-            logger.info(f"🔧 Formatting {len(jobs)} jobs")
-            for i, job in enumerate(jobs):
-                try:
-                    formatted_job = self._format_single_job(job)
-                    formatted_jobs.append(formatted_job)
-                    logger.info(f"✅ Formatted job {i+1}: {formatted_job.get('title', 'No title')}")
-                except Exception as e:
-                    logger.error(f"❌ Error formatting job {i+1}: {str(e)}")
-                    logger.error(f"❌ Job data: {job}")
+            try:
+                formatted_jobs = list(map(self._format_single_job, jobs))
+            except Exception:
+                # A malformed job - format one at a time so the others still show
+                for i, job in enumerate(jobs):
+                    try:
+                        formatted_jobs.append(self._format_single_job(job))
+                    except Exception as e:
+                        logger.error(f"❌ Error formatting job {i+1}: {str(e)}")
+                        logger.error(f"❌ Job data: {job}")
         
         # Create response content
         if formatted_jobs:
             content = f"Found {len(formatted_jobs)} job opportunities matching your search:"
-            logger.info(f"✅ Successfully formatted {len(formatted_jobs)} jobs")
+            logger.info(f"✅ Formatted {len(formatted_jobs)}/{len(jobs)} jobs")
         else:
             # Provide more helpful messaging based on what we found
             if isinstance(jobs, list) and len(jobs) > 0:
@@ -801,28 +990,40 @@ class JobSearchAgent(BaseAgent):
     
     def _format_single_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Format a single job entry following the improved format"""
+        job_id = job.get('_id') or job.get('job_id')
+        title = job.get('job_title') or job.get('title')
+        company = job.get('company')
+        locations = job.get('locations')
+        location = job.get('location')
+        skills = job.get('skills')
+        description = job.get('description')
+        work_mode = job.get('work_mode')
+        job_type = job.get('job_type')
+        job_url = job.get('job_url')
+        posted_date = job.get('posted_date')
+        
         return {
-            'id': job.get('_id') or job.get('job_id'),
-            'title': job.get('job_title') or job.get('title'),
-            'company': job.get('company', {}).get('name') if isinstance(job.get('company'), dict) else job.get('company') or "Company not specified",
-            'location': ', '.join(job.get('locations', [])) if isinstance(job.get('locations'), list) else job.get('location') or "Location not specified",
+            'id': job_id,
+            'title': title,
+            'company': company.get('name') if isinstance(company, dict) else company or "Company not specified",
+            'location': ', '.join(locations) if isinstance(locations, list) else location or "Location not specified",
             'salary': job.get('salary') or "Salary not disclosed",
             'experience': job.get('experience') or "Experience not specified",
-            'skills': job.get('skills')[:5] if isinstance(job.get('skills'), list) else [],
-            'workMode': job.get('work_mode') or "Not specified",
-            'jobType': job.get('job_type') or "Full-time",
-            'description': job.get('description', {}).get('text') if isinstance(job.get('description'), dict) else job.get('description') or "",
-            'postedDate': job.get('created_at') or job.get('posted_date'),
-            'url': job.get('job_url') or job.get('url'),
+            'skills': skills[:5] if isinstance(skills, list) else [],
+            'workMode': work_mode or "Not specified",
+            'jobType': job_type or "Full-time",
+            'description': description.get('text') if isinstance(description, dict) else description or "",
+            'postedDate': job.get('created_at') or posted_date,
+            'url': job_url or job.get('url'),
             # Legacy fields for backward compatibility
-            '_id': job.get('_id') or job.get('job_id'),
+            '_id': job_id,
             'job_id': job.get('job_id') or job.get('id'),
-            'job_title': job.get('job_title') or job.get('title'),
-            'locations': job.get('locations') or ([job.get('location')] if job.get('location') else []),
-            'work_mode': job.get('work_mode') or job.get('remote_type'),
-            'job_type': job.get('job_type') or job.get('employment_type'),
-            'posted_date': job.get('posted_date') or job.get('date_posted'),
-            'source_url': job.get('source_url') or job.get('job_url'),
+            'job_title': title,
+            'locations': locations or ([location] if location else []),
+            'work_mode': work_mode or job.get('remote_type'),
+            'job_type': job_type or job.get('employment_type'),
+            'posted_date': posted_date or job.get('date_posted'),
+            'source_url': job.get('source_url') or job_url,
             'apply_url': job.get('apply_url') or job.get('application_url'),
             'source_platform': job.get('source_platform') or job.get('platform')
         }
@@ -844,35 +1045,30 @@ class JobSearchAgent(BaseAgent):
             
             # Get LLM response
             llm_response = await self.llm_client.generate_response(full_prompt, "")
-            logger.info(f"🧠 LLM raw response: {llm_response}")
+            logger.debug(f"🧠 LLM raw response: {llm_response}")
             
-            # Try to parse the JSON response
-            try:
-                # Clean the response (remove any extra text)
-                response_lines = llm_response.strip().split('\n')
-                for line in response_lines:
-                    line = line.strip()
-                    if line.startswith('{') and line.endswith('}'):
-                        parsed_params = json.loads(line)
-                        logger.info(f"✅ Successfully parsed LLM parameters: {parsed_params}")
-                        
-                        # 🎓 Clean job title if internship is detected
-                        parsed_params = self._clean_internship_job_title(parsed_params)
-                        
-                        return parsed_params
-               
-                # If no JSON line found, try to parse the entire response
-                if llm_response.strip().startswith('{') and llm_response.strip().endswith('}'):
-                    parsed_params = json.loads(llm_response.strip())
-                    logger.info(f"✅ Successfully parsed LLM parameters: {parsed_params}")
-                    
-                    # 🎓 Clean job title if internship is detected
-                    parsed_params = self._clean_internship_job_title(parsed_params)
-                    
-                    return parsed_params
+            # Try to parse the JSON response: decode the first JSON object, ignoring any
+            # text or code fences around it (handles pretty-printed multi-line JSON too).
+            # A stray '{' in the prose before the JSON just moves on to the next one
+            decode_error = None
+            json_start = llm_response.find('{')
+            while json_start != -1:
+                try:
+                    parsed_params, _ = _JSON_DECODER.raw_decode(llm_response, json_start)
+                except json.JSONDecodeError as e:
+                    decode_error = e
+                    json_start = llm_response.find('{', json_start + 1)
+                    continue
+                
+                logger.info("✅ Successfully parsed LLM parameters: %s", parsed_params)
+                
+                # 🎓 Clean job title if internship is detected
+                parsed_params = self._clean_internship_job_title(parsed_params)
                 
-            except json.JSONDecodeError as e:
-                logger.warning(f"⚠️ Failed to parse LLM JSON response: {e}")
+                return parsed_params
+            
+            if decode_error is not None:
+                logger.warning(f"⚠️ Failed to parse LLM JSON response: {decode_error}")
                 logger.warning(f"⚠️ Raw response was: {llm_response}")
             
             # Fallback: basic keyword extraction
@@ -888,45 +1084,24 @@ class JobSearchAgent(BaseAgent):
             return params
         
         job_title = params['job_title']
-        internship_keywords = ['intern', 'internship', 'internships', 'trainee', 'graduate', 'student', 'summer intern', 'winter intern']
         
         # Clean the job title
-        cleaned_title = job_title.lower()
-        for keyword in internship_keywords:
-            cleaned_title = cleaned_title.replace(keyword, '').strip()
+        cleaned_title = _INTERNSHIP_KEYWORD_RE.sub('', job_title.lower())
         
         # Remove extra spaces and clean up
         cleaned_title = ' '.join(cleaned_title.split())
         
         # If we have a meaningful title left, use it
         if cleaned_title and len(cleaned_title) > 2:
-            # Capitalize properly
-            if 'flutter' in cleaned_title:
-                params['job_title'] = 'Flutter Developer'
-            elif 'android' in cleaned_title:
-                params['job_title'] = 'Android Developer'
-            elif 'ios' in cleaned_title:
-                params['job_title'] = 'iOS Developer'
-            elif 'react' in cleaned_title:
-                params['job_title'] = 'React Developer'
-            elif 'python' in cleaned_title:
-                params['job_title'] = 'Python Developer'
-            elif 'java' in cleaned_title and 'javascript' not in cleaned_title:
-                params['job_title'] = 'Java Developer'
-            elif 'javascript' in cleaned_title or 'js' in cleaned_title:
-                params['job_title'] = 'JavaScript Developer'
-            elif 'node' in cleaned_title:
-                params['job_title'] = 'Node.js Developer'
-            elif 'full stack' in cleaned_title or 'fullstack' in cleaned_title:
-                params['job_title'] = 'Full Stack Developer'
-            elif 'frontend' in cleaned_title or 'front-end' in cleaned_title:
-                params['job_title'] = 'Frontend Developer'
-            elif 'backend' in cleaned_title or 'back-end' in cleaned_title:
-                params['job_title'] = 'Backend Developer'
-            elif 'data scien' in cleaned_title:
-                params['job_title'] = 'Data Scientist'
-            elif 'devops' in cleaned_title:
-                params['job_title'] = 'DevOps Engineer'
+            # Map known technologies to a canonical title in one scan of the title
+            matched_roles = _roles_for_keywords({
+                match.group('role') for match in _FALLBACK_KEYWORD_RE.finditer(cleaned_title)
+                if match.lastgroup == 'role'
+            })
+            for role, title in _INTERNSHIP_TITLE_ROLES:
+                if role in matched_roles:
+                    params['job_title'] = title
+                    break
             else:
                 # Capitalize the first letter of each word
                 params['job_title'] = ' '.join(word.capitalize() for word in cleaned_title.split())
@@ -936,96 +1111,150 @@ class JobSearchAgent(BaseAgent):
     
     def _fallback_query_parsing(self, query: str) -> Dict[str, Any]:
         """Fallback method for basic query parsing if LLM fails"""
+        params = dict(self._parse_fallback_query(query.lower().strip()))
+        
+        if params.get('internship'):
+            logger.info(f"🎓 Detected internship request in fallback parsing")
+        
+        logger.info("🔄 Fallback parsing result: %s", params)
+        return params
+    
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _parse_fallback_query(query_lower: str) -> Tuple[Tuple[str, Any], ...]:
+        """Parse a lowercased query into search params, cached since users repeat the same searches"""
         params = {}
-        query_lower = query.lower()
         
         # Remove common action words to focus on job-related terms
         cleaned_query = query_lower
-        for action_word in ['suggest', 'find', 'show me', 'search for', 'look for', 'get me', 'give me']:
+        for action_word in _ACTION_WORDS:
             cleaned_query = cleaned_query.replace(action_word, '').strip()
         
         # 🎓 IMPROVED INTERNSHIP DETECTION - Check for internship keywords first
-        internship_keywords = ['intern', 'internship', 'internships', 'trainee', 'graduate', 'student', 'summer intern', 'winter intern']
-        is_internship = any(keyword in cleaned_query for keyword in internship_keywords)
+        is_internship = _INTERNSHIP_KEYWORD_RE.search(cleaned_query) is not None
         
         if is_internship:
-            params['internship'] = True
-            params['job_type'] = 'internship'
+            params.update(_INTERNSHIP_FILTER)
             # Don't add experience parameters for internships
-            logger.info(f"🎓 Detected internship request in fallback parsing")
             
             # Clean the query to remove internship keywords for job title extraction
-            for keyword in internship_keywords:
-                cleaned_query = cleaned_query.replace(keyword, '').strip()
+            cleaned_query = _INTERNSHIP_KEYWORD_RE.sub('', cleaned_query)
             
             # Remove extra spaces and clean up
             cleaned_query = ' '.join(cleaned_query.split())
         
-        # Basic job title extraction (now with cleaned query)
-        if 'android' in cleaned_query:
-            params['job_title'] = 'Android Developer'
-            params['skills'] = 'Android,Kotlin,Java'
-        elif 'flutter' in cleaned_query:
-            params['job_title'] = 'Flutter Developer'
-            params['skills'] = 'Flutter,Dart,Mobile Development'
-        elif 'ios' in cleaned_query:
-            params['job_title'] = 'iOS Developer'
-            params['skills'] = 'iOS,Swift,Objective-C'
-        elif 'full stack' in cleaned_query or 'fullstack' in cleaned_query:
-            params['job_title'] = 'Full Stack Developer'
-            params['skills'] = 'JavaScript,React,Node.js,MongoDB'
-        elif 'python' in cleaned_query:
-            params['job_title'] = 'Python Developer'
-            params['skills'] = 'Python'
-        elif 'java' in cleaned_query and 'javascript' not in cleaned_query:
-            params['job_title'] = 'Java Developer'
-            params['skills'] = 'Java'
-        elif 'javascript' in cleaned_query or 'js' in cleaned_query:
-            params['job_title'] = 'JavaScript Developer'
-            params['skills'] = 'JavaScript'
-        elif 'react' in cleaned_query:
-            params['job_title'] = 'React Developer'
-            params['skills'] = 'React,JavaScript'
-        elif 'node' in cleaned_query:
-            params['job_title'] = 'Node.js Developer'
-            params['skills'] = 'Node.js,JavaScript'
-        elif 'data scien' in cleaned_query:
-            params['job_title'] = 'Data Scientist'
-            params['skills'] = 'Python,Machine Learning,Data Science'
-        elif 'devops' in cleaned_query:
-            params['job_title'] = 'DevOps Engineer'
-            params['skills'] = 'DevOps,AWS,Docker,Kubernetes'
-        elif 'frontend' in cleaned_query or 'front-end' in cleaned_query:
-            params['job_title'] = 'Frontend Developer'
-            params['skills'] = 'HTML,CSS,JavaScript,React'
-        elif 'backend' in cleaned_query or 'back-end' in cleaned_query:
-            params['job_title'] = 'Backend Developer'
-            params['skills'] = 'Node.js,Python,Java'
+        # Collect role, work mode and seniority keywords in a single scan
+        keyword_hits = {'role': set(), 'work_mode': set(), 'seniority': set()}
+        for match in _FALLBACK_KEYWORD_RE.finditer(cleaned_query):
+            keyword_hits[match.lastgroup].add(match.group(match.lastgroup))
+        
+        # Basic job title extraction (now with cleaned query) - highest priority role wins
+        matched_keywords = keyword_hits['role']
+        if matched_keywords:
+            matched_roles = _roles_for_keywords(matched_keywords)
+            for role, _, role_params in _FALLBACK_ROLES:
+                if role in matched_roles:
+                    params.update(role_params)
+                    break
         
         # Work mode detection
-        if 'remote' in cleaned_query:
-            params['work_mode'] = 'remote'
-        elif 'onsite' in cleaned_query or 'on-site' in cleaned_query:
-            params['work_mode'] = 'on-site'
-        elif 'hybrid' in cleaned_query:
-            params['work_mode'] = 'hybrid'
+        matched_work_modes = {_WORK_MODE_BY_KEYWORD[keyword] for keyword in keyword_hits['work_mode']}
+        for work_mode in _WORK_MODE_PRIORITY:
+            if work_mode in matched_work_modes:
+                params['work_mode'] = work_mode
+                break
         
         # Experience level detection (only if not already an internship)
         if not is_internship:
-            if 'senior' in cleaned_query:
+            if 'senior' in keyword_hits['seniority']:
                 params['experience_min'] = "5"
-            elif 'junior' in cleaned_query:
+            elif 'junior' in keyword_hits['seniority']:
                 params['experience_max'] = "2"
         
         # Only set general query if we have meaningful terms and no specific job title
         if not params.get('job_title') and len(cleaned_query.strip()) > 2:
             # Only include meaningful words (not partial words)
-            meaningful_words = [word for word in cleaned_query.split() if len(word) > 3]
+            meaningful_words = _MEANINGFUL_WORD_RE.findall(cleaned_query)
             if meaningful_words:
                 params['query'] = ' '.join(meaningful_words)
         
-        logger.info(f"🔄 Fallback parsing result: {params}")
-        return params 
+        return tuple(params.items())
+    
+    def _store_current_page(self, session_id: str, page: int) -> None:
+        """Store the last shown results page for a session in Redis"""
+        try:
+            redis_client = _get_redis_client()
+            redis_client.setex(f"last_page:{session_id}", 3600, str(page))
+            logger.info(f"💾 Stored current page {page} for session {session_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not store current page: {str(e)}")
+    
+    async def _search_jobs_cached(self, token: str, base_url: str, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a job search, reusing the result of an identical recent search when caching is on"""
+        cache_ttl = current_config.JOB_SEARCH_CACHE_TTL
+        if cache_ttl <= 0 or not token:
+            # Unauthenticated calls are left for the backend to reject, never served from cache
+            return await self._search_jobs_coalesced(token, base_url, search_params)
+        
+        cache_key = _search_cache_key(token, search_params)
+        try:
+            cached_result = _get_redis_client().get(cache_key)
+            if cached_result:
+                logger.info("✅ Using cached job search results for %s", search_params)
+                return json.loads(cached_result)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read job search cache: {str(e)}")
+        
+        job_search_result = await self._search_jobs_coalesced(token, base_url, search_params)
+        if job_search_result.get('success'):
+            # Encode now: search_jobs merges broader results into this dict after we return
+            _REDIS_WRITE_EXECUTOR.submit(
+                self._store_search_result, cache_key, cache_ttl, _JSON_CACHE_ENCODER.encode(job_search_result)
+            )
+        return job_search_result
+    
+    def _search_jobs_cached_blocking(self, token: str, base_url: str, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run _search_jobs_cached to completion on a worker thread, which has no event loop of its own"""
+        return asyncio.run(self._search_jobs_cached(token, base_url, search_params))
+    
+    async def _search_jobs_coalesced(self, token: str, base_url: str, search_params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a job search, sharing one backend call between identical concurrent searches"""
+        flight_key = (base_url, _search_cache_key(token, search_params))
+        with _INFLIGHT_SEARCHES_LOCK:
+            flight = _INFLIGHT_SEARCHES.get(flight_key)
+            if flight is None:
+                flight = _INFLIGHT_SEARCHES[flight_key] = [Future(), 0]
+                is_leader = True
+            else:
+                flight[1] += 1
+                is_leader = False
+        
+        if not is_leader:
+            logger.info("🔗 Joining in-flight job search for %s", search_params)
+            # Callers modify the result they get back, so each waiter takes its own copy
+            return copy.deepcopy(await asyncio.wrap_future(flight[0]))
+        
+        try:
+            job_search_result = await self.search_jobs_tool(token, base_url, **search_params)
+        except BaseException as e:
+            with _INFLIGHT_SEARCHES_LOCK:
+                del _INFLIGHT_SEARCHES[flight_key]
+            flight[0].set_exception(e)
+            raise
+        
+        with _INFLIGHT_SEARCHES_LOCK:
+            del _INFLIGHT_SEARCHES[flight_key]
+            waiter_count = flight[1]
+        # Hand waiters a snapshot so they are not copying a result this caller is still changing
+        flight[0].set_result(copy.deepcopy(job_search_result) if waiter_count else job_search_result)
+        return job_search_result
+    
+    def _store_search_result(self, cache_key: str, cache_ttl: int, result_json: str) -> None:
+        """Cache an encoded, successful job search result in Redis"""
+        try:
+            _get_redis_client().setex(cache_key, cache_ttl, result_json)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not cache job search results: {str(e)}")
     
     async def search_jobs_follow_up(self, routing_data: Dict[str, Any], page: int = 2) -> Dict[str, Any]:
         """Follow-up job search for pagination"""
@@ -1033,15 +1262,19 @@ class JobSearchAgent(BaseAgent):
             logger.info(f"🔄 Follow-up job search for page {page}")
             
             # Get the original search context
-            extracted_data = routing_data.get('extractedData', {})
-            original_query = routing_data.get('originalQuery', '')
+            routing_get = routing_data.get
+            token = routing_get('token', '')
+            base_url = routing_get('baseUrl', self.base_url)
+            session_id = routing_get('sessionId', 'default')
+            extracted_data = routing_get('extractedData', {})
+            original_query = routing_get('originalQuery', '')
             
             # Get stored search params from context
             stored_search_params = extracted_data.get('search_params', {})
             
             # Build search parameters for follow-up
             search_params = {
-                'limit': 10,  # Show 10 jobs per page
+                'limit': self._PAGE_LIMIT,
                 'page': page
             }
             
@@ -1049,9 +1282,9 @@ class JobSearchAgent(BaseAgent):
             if stored_search_params:
                 # Copy all search params except page and limit
                 for key, value in stored_search_params.items():
-                    if key not in ['page', 'limit']:
+                    if key not in _PAGING_KEYS:
                         search_params[key] = value
-                logger.info(f"🔄 Using stored search params for page {page}: {search_params}")
+                logger.info("🔄 Using stored search params for page %s: %s", page, search_params)
             else:
                 # Fallback to extracted data
                 if extracted_data.get('skills'):
@@ -1068,8 +1301,7 @@ class JobSearchAgent(BaseAgent):
                 # 🎓 Check for internship from multiple sources
                 if (extracted_data.get('internship') is True or 
                     extracted_data.get('job_type') == 'internship'):
-                    search_params['internship'] = True
-                    search_params['job_type'] = 'internship'
+                    search_params.update(_INTERNSHIP_FILTER)
                     # Remove experience parameters for internships
                     search_params.pop('experience_min', None)
                     search_params.pop('experience_max', None)
@@ -1077,14 +1309,10 @@ class JobSearchAgent(BaseAgent):
                 if extracted_data.get('job_title'):
                     search_params['job_title'] = extracted_data['job_title']
                 
-                logger.info(f"🔄 Using extracted data for page {page}: {search_params}")
+                logger.info("🔄 Using extracted data for page %s: %s", page, search_params)
             
             # Perform the search using the job search tool
-            job_search_result = await self.search_jobs_tool(
-                token=routing_data.get('token', ''),
-                base_url=routing_data.get('baseUrl', self.base_url),
-                **search_params
-            )
+            job_search_result = await self._search_jobs_cached(token, base_url, search_params)
             
             if not job_search_result or not job_search_result.get('success'):
                 return {
@@ -1104,48 +1332,17 @@ class JobSearchAgent(BaseAgent):
                     'metadata': {'error': 'No more jobs'}
                 }
             
-            # Store current page in Redis for pagination tracking
-            try:
-                current_config = config[os.environ.get('FLASK_ENV', 'development')]
-                redis_url = current_config.REDIS_URL
-                redis_ssl = current_config.REDIS_SSL
-                
-                if redis_ssl:
-                    redis_client = redis.from_url(
-                        redis_url,
-                        decode_responses=True,
-                        ssl=True,
-                        ssl_cert_reqs=None
-                    )
-                else:
-                    redis_client = redis.from_url(
-                        redis_url,
-                        decode_responses=True
-                    )
-                
-                session_id = routing_data.get('sessionId', 'default')
-                redis_client.setex(f"last_page:{session_id}", 3600, str(page))
-                logger.info(f"💾 Stored current page {page} for session {session_id}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not store current page: {str(e)}")
+            # Store current page in Redis before replying - app.py reads it to pick the "load more" page
+            self._store_current_page(session_id, page)
             
             # Format jobs for display
-            formatted_jobs = []
-            for job in jobs:
-                formatted_job = self.format_job_for_response(job)
-                formatted_jobs.append(formatted_job)
+            formatted_jobs = [self.format_job_for_response(job) for job in jobs]
             
             # Calculate pagination info
-            jobs_per_page = search_params['limit']
+            jobs_per_page = self._PAGE_LIMIT
             total_pages = (total_jobs + jobs_per_page - 1) // jobs_per_page
             has_more = page < total_pages
             
-            # Create response message
-            if has_more:
-                message = f"Here are {len(formatted_jobs)} more job opportunities:\n\n📋 Job Opportunities\nShowing page {page} of {total_pages} (Jobs {((page-1) * jobs_per_page) + 1}-{min(page * jobs_per_page, total_jobs)} of {total_jobs})"
-            else:
-                message = f"Here are the final {len(formatted_jobs)} job opportunities:\n\n📋 Job Opportunities\nFinal page {page} of {total_pages} (Jobs {((page-1) * jobs_per_page) + 1}-{total_jobs} of {total_jobs})"
-            
             # Storage is handled by app.py to avoid duplication
             
             return self.response_formatter.format_job_response(
@@ -1172,36 +1369,37 @@ class JobSearchAgent(BaseAgent):
     
     async def _build_broader_search_params(self, extracted_data: Dict[str, Any], original_params: Dict[str, Any]) -> Dict[str, Any]:
         """Build broader search parameters when initial search returns no results"""
-        broader_params = original_params.copy()
-        
-        # Remove restrictive filters but keep essential ones
-        broader_params.pop('experience_min', None)
-        broader_params.pop('experience_max', None)
-        broader_params.pop('salary_min', None)
-        broader_params.pop('salary_max', None)
-        broader_params.pop('work_mode', None)
-        broader_params.pop('job_type', None)
-        
-        # IMPORTANT: Remove job_title completely - don't use it in broader search
-        broader_params.pop('job_title', None)
+        # Whitelist what carries over from the original search - restrictive filters
+        # (experience, salary, work_mode, job_type) are rebuilt below and job_title
+        # is dropped completely
+        preserved_params = {key: original_params[key] for key in _BROADER_PRESERVED_KEYS if original_params.get(key)}
         
         # Keep only essential parameters
         essential_params = {
-            'limit': 10,  # Show 10 jobs per page
-            'page': 1
+            'limit': self._PAGE_LIMIT,
+            'page': 1,
+            **preserved_params
         }
         
+        # Read each extracted field once
+        location = extracted_data.get('location')
+        extracted_skills = extracted_data.get('skills')
+        exp_min = extracted_data.get('experience_min')
+        exp_max = extracted_data.get('experience_max')
+        salary_min = extracted_data.get('salary_min')
+        salary_max = extracted_data.get('salary_max')
+        internship = extracted_data.get('internship')
+        
         # Add location if available (keep it)
-        if extracted_data.get('location'):
-            essential_params['locations'] = extracted_data['location']
+        if location:
+            essential_params['locations'] = location
         
         # CRITICAL: Preserve skills from original search to maintain relevance
-        if original_params.get('skills'):
-            essential_params['skills'] = original_params['skills']
-            logger.info(f"🔄 Preserving skills in broader search: {original_params['skills']}")
-        elif extracted_data.get('skills'):
-            essential_params['skills'] = extracted_data['skills']
-            logger.info(f"🔄 Using extracted skills in broader search: {extracted_data['skills']}")
+        if 'skills' in preserved_params:
+            logger.info(f"🔄 Preserving skills in broader search: {preserved_params['skills']}")
+        elif extracted_skills:
+            essential_params['skills'] = extracted_skills
+            logger.info(f"🔄 Using extracted skills in broader search: {extracted_skills}")
         else:
             # Auto-detect skills from the query for broader search
             auto_skills = await self._enhance_skills_from_job_title(extracted_data)
@@ -1210,10 +1408,12 @@ class JobSearchAgent(BaseAgent):
                 logger.info(f"🔄 Auto-detected skills for broader search: {auto_skills}")
         
         # Add experience range but make it broader
-        if extracted_data.get('experience_min') is not None or extracted_data.get('experience_max') is not None:
+        if exp_min is not None or exp_max is not None:
             # Broaden experience range
-            exp_min = extracted_data.get('experience_min', 0)
-            exp_max = extracted_data.get('experience_max', 10)
+            if exp_min is None:
+                exp_min = 0
+            if exp_max is None:
+                exp_max = 10
             
             # Make range broader: reduce min by 1, increase max by 2
             broader_min = max(0, exp_min - 1)
@@ -1223,10 +1423,12 @@ class JobSearchAgent(BaseAgent):
             essential_params['experience_max'] = broader_max
         
         # Add salary range but make it broader
-        if extracted_data.get('salary_min') is not None or extracted_data.get('salary_max') is not None:
+        if salary_min is not None or salary_max is not None:
             # Broaden salary range
-            salary_min = extracted_data.get('salary_min', 0)
-            salary_max = extracted_data.get('salary_max', 1000000)
+            if salary_min is None:
+                salary_min = 0
+            if salary_max is None:
+                salary_max = 1000000
             
             # Make range broader: reduce min by 20%, increase max by 30%
             broader_min = max(0, int(salary_min * 0.8))
@@ -1236,49 +1438,24 @@ class JobSearchAgent(BaseAgent):
             essential_params['salary_max'] = broader_max
         
         # IMPROVED: Handle internship filter more intelligently
-        # Check if user has substantial skills before defaulting to internships
-        has_substantial_skills = self._has_substantial_technical_skills(extracted_data, {}, {})
-        
         # 🎓 Check for internship from multiple sources
         is_internship_request = (
-            extracted_data.get('internship') is True or 
+            internship is True or 
             extracted_data.get('job_type') == 'internship'
         )
         
-        if is_internship_request:
-            # User explicitly requested internship
-            essential_params['internship'] = True
-            essential_params['job_type'] = 'internship'
-            # Remove experience parameters for internships
-            essential_params.pop('experience_min', None)
-            essential_params.pop('experience_max', None)
-            logger.info(f"🔄 Broader search: User requested internship - removing experience filters")
-        elif extracted_data.get('internship') is False:
-            # User explicitly said no internships
-            essential_params['internship'] = False
-            essential_params['job_type'] = 'full-time'
-            logger.info(f"🔄 Broader search: User explicitly requested non-internship positions")
-        else:
-            # No explicit internship request - default based on skills
-            if has_substantial_skills:
-                essential_params['internship'] = False
-                essential_params['job_type'] = 'full-time'
-                logger.info(f"🔄 Broader search: Defaulting to full-time for user with substantial skills")
-            else:
-                # Entry-level user, allow both internship and full-time
-                essential_params.pop('internship', None)  # Remove internship filter to get both types
-                essential_params.pop('job_type', None)
-                logger.info(f"🔄 Broader search: Entry-level user - allowing both internship and full-time positions")
+        # Internship/job_type are never carried over, so entry-level users get both types
+        self._apply_internship_filter(essential_params, extracted_data, is_internship_request, {}, {}, log_prefix='Broader search: ')
         
         # If we have a query but no specific job title, use it
-        if extracted_data.get('query') and not extracted_data.get('job_title'):
-            essential_params['query'] = extracted_data['query']
+        query = extracted_data.get('query')
+        if query and not extracted_data.get('job_title'):
+            essential_params['query'] = query
         
-        logger.info(f"🔄 Built broader search params: {essential_params}")
+        logger.info("🔄 Built broader search params: %s", essential_params)
         return essential_params
 
     def _is_unrealistic_location(self, location: str) -> bool:
         if not location:
             return False
-        location_lower = location.strip().lower()
-        return any(loc in location_lower for loc in self.UNREALISTIC_LOCATIONS) 
\ No newline at end of file
+        return self._UNREALISTIC_LOCATION_RE.search(location.lower()) is not None
\ No newline at end of file
@@ -37,9 +37,15 @@ app.config.from_object(config[os.environ.get('FLASK_ENV', 'development')])
 # Enable CORS for cross-origin requests
 CORS(app, origins=["http://localhost:5173", "http://127.0.0.1:5173", "http://localhost:3000", "http://127.0.0.1:3000"], supports_credentials=True)
 
+# Skip sorting keys when serialising API responses; clients read them by name
+app.json.sort_keys = False
+
 # Get configuration
 current_config = config[os.environ.get('FLASK_ENV', 'development')]
 
+# Compact encoder for the job card payloads cached in Redis
+_JOB_CACHE_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
 # Initialize SocketIO with enhanced configuration and error handling
 socketio = SocketIO(
     app, 
@@ -1253,13 +1259,19 @@ def handle_agent_response(socket, response):
         session_id = active_sessions.get(request.sid)
         if session_id and redis_client:
             try:
+                # Queue all writes and send them to Redis in a single round trip
+                pipe = redis_client.pipeline(transaction=False)
+                
                 # Cache jobs and metadata for session replay
-                redis_client.setex(f"job_agent:jobs:{session_id}", 3600, json.dumps(metadata.get('jobs')))
-                redis_client.setex(f"job_agent:metadata:{session_id}", 3600, json.dumps(metadata))
+                pipe.setex(f"job_agent:jobs:{session_id}", 3600, _JOB_CACHE_ENCODER.encode(metadata.get('jobs')))
+                pipe.setex(f"job_agent:metadata:{session_id}", 3600, _JOB_CACHE_ENCODER.encode(metadata))
                 
                 # Store search context for follow-up searches
                 if metadata.get('searchContext'):
-                    redis_client.setex(f"last_search_context:{session_id}", 3600, json.dumps(metadata['searchContext']))
+                    pipe.setex(f"last_search_context:{session_id}", 3600, _JOB_CACHE_ENCODER.encode(metadata['searchContext']))
+                
+                pipe.execute()
+                if metadata.get('searchContext'):
                     logger.info(f"💾 Stored search context for session {session_id}")
             except Exception as e:
                 logger.warn(f"⚠️ Failed to cache job data: {str(e)}")
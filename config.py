@@ -65,6 +65,12 @@ class Config:
     AGENT_TIMEOUT_SECONDS = 30
     MAX_RETRIES = 3
     
+    # Job search configuration - start the broader fallback search alongside the
+    # primary one (costs an extra backend call when the primary search is enough)
+    SPECULATIVE_BROADER_SEARCH = os.environ.get('SPECULATIVE_BROADER_SEARCH', 'False').lower() in ['true', '1', 'yes']
+    # Seconds to reuse identical job search results from Redis (0 disables the cache)
+    JOB_SEARCH_CACHE_TTL = int(os.environ.get('JOB_SEARCH_CACHE_TTL', '0'))
+    
  
     # WebSocket Events Configuration
     SOCKET_EVENTS = {
@@ -0,0 +1,51 @@
+import atexit
+import http.cookiejar
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing for the shared session
+POOL_CONNECTIONS = 20   # Number of distinct hosts to keep pools for
+POOL_MAXSIZE = 100      # Keep-alive connections per host
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Get the process-wide HTTP session so API calls reuse keep-alive connections"""
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # The session is shared by every user's requests, so never keep cookies
+                # from one response and send them on someone else's call
+                session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+                logger.info(f"🌐 Created shared HTTP session (pool size: {POOL_MAXSIZE})")
+
+    return _session
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and release pooled connections"""
+    global _session
+
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            logger.info("🌐 Closed shared HTTP session")
+
+
+atexit.register(close_session)
@@ -6,11 +6,18 @@ from urllib.parse import urlencode
 import os
 import io
 import time
+import random
 import jwt
 from datetime import datetime
+from .http_session import get_session
 
 logger = logging.getLogger(__name__)
 
+# Timeout retries wait 1s, then 2s, ..., plus jitter so requests that timed
+# out together do not all retry at the same instant
+TIMEOUT_RETRY_BASE_DELAY = 1.0
+TIMEOUT_RETRY_MAX_JITTER = 0.25
+
 class JobMatoTools:
     """Comprehensive tools for JobMato API operations"""
     
@@ -73,11 +80,12 @@ class JobMatoTools:
             # Start timing
             start_time = time.time()
             
-            # Make the request
+            # Make the request over the shared keep-alive session
+            session = get_session()
             response = None
             if method.upper() == 'GET':
                 logger.info(f"📤 Making GET request with timeout: {self.timeout}s")
-                response = requests.get(url, headers=headers, params=params, timeout=self.timeout)
+                response = session.get(url, headers=headers, params=params, timeout=self.timeout)
                 
             elif method.upper() == 'POST':
                 if files:
@@ -101,10 +109,10 @@ class JobMatoTools:
                                 logger.info(f"📁 File '{key}': {filename}, size: {len(content)} bytes")
                     
                     logger.info(f"📤 Making POST request (file upload) with timeout: {self.timeout}s")
-                    response = requests.post(url, headers=headers, files=files, data=data, timeout=self.timeout)
+                    response = session.post(url, headers=headers, files=files, data=data, timeout=self.timeout)
                 else:
                     logger.info(f"📤 Making POST request (JSON) with timeout: {self.timeout}s")
-                    response = requests.post(url, headers=headers, json=data, timeout=self.timeout)
+                    response = session.post(url, headers=headers, json=data, timeout=self.timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -155,7 +163,7 @@ class JobMatoTools:
             # Retry logic for timeouts
             if retry_count < self.max_retries:
                 logger.info(f"🔄 Retrying request [{request_id}] ({retry_count + 1}/{self.max_retries})")
-                time.sleep(1)  # Brief delay before retry
+                time.sleep(TIMEOUT_RETRY_BASE_DELAY * (2 ** retry_count) + random.uniform(0, TIMEOUT_RETRY_MAX_JITTER))
                 return self._make_request(method, endpoint, token, params, data, files, retry_count + 1)
             else:
                 logger.error(f"❌ Max retries exceeded for [{request_id}]")
@@ -5,6 +5,32 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+def safe_get_string(value, default=""):
+    """Safely extract string value from potentially complex objects"""
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, dict):
+        # Try to get name or title from object
+        return value.get('name', value.get('title', value.get('display_name', default)))
+    elif isinstance(value, list):
+        # Join list items
+        return ', '.join([safe_get_string(item) for item in value])
+    elif value is None:
+        return default
+    else:
+        return str(value)
+
+def safe_get_list(value, default=None):
+    """Safely extract list value"""
+    if isinstance(value, list):
+        return value
+    elif isinstance(value, str):
+        return [value]
+    elif value is None:
+        return default or []
+    else:
+        return [str(value)]
+
 class ResponseFormatter:
     """Utility class for formatting responses to match Dart ChatBoatHistoryModel"""
     
@@ -264,44 +290,25 @@ class ResponseFormatter:
     
     def _format_single_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Format a single job to match Dart Job model structure"""
-        def safe_get_string(value, default=""):
-            """Safely extract string value from potentially complex objects"""
-            if isinstance(value, str):
-                return value
-            elif isinstance(value, dict):
-                return value.get('name', value.get('title', value.get('display_name', default)))
-            elif isinstance(value, list):
-                return ', '.join([safe_get_string(item) for item in value])
-            elif value is None:
-                return default
-            else:
-                return str(value)
-        
-        def safe_get_list(value, default=None):
-            """Safely extract list value"""
-            if isinstance(value, list):
-                return value
-            elif isinstance(value, str):
-                return [value]
-            elif value is None:
-                return default or []
-            else:
-                return [str(value)]
+        company = job.get('company')
+        experience = job.get('experience')
+        salary = job.get('salary')
+        locations = job.get('locations')
         
         # Format company information
         company_info = None
-        if job.get('company'):
-            if isinstance(job['company'], dict):
+        if company:
+            if isinstance(company, dict):
                 company_info = {
-                    'name': job['company'].get('name', ''),
-                    'url': job['company'].get('url', ''),
-                    'logo': job['company'].get('logo', ''),
-                    'size': job['company'].get('size', ''),
-                    'sector': job['company'].get('sector', '')
+                    'name': company.get('name', ''),
+                    'url': company.get('url', ''),
+                    'logo': company.get('logo', ''),
+                    'size': company.get('size', ''),
+                    'sector': company.get('sector', '')
                 }
             else:
                 company_info = {
-                    'name': safe_get_string(job['company']),
+                    'name': safe_get_string(company),
                     'url': '',
                     'logo': '',
                     'size': '',
@@ -310,11 +317,11 @@ class ResponseFormatter:
         
         # Format experience information
         experience_info = None
-        if job.get('experience'):
-            if isinstance(job['experience'], dict):
+        if experience:
+            if isinstance(experience, dict):
                 experience_info = {
-                    'minYears': job['experience'].get('min', job['experience'].get('min_years')),
-                    'maxYears': job['experience'].get('max', job['experience'].get('max_years'))
+                    'minYears': experience.get('min', experience.get('min_years')),
+                    'maxYears': experience.get('max', experience.get('max_years'))
                 }
             else:
                 experience_info = {
@@ -324,22 +331,23 @@ class ResponseFormatter:
         
         # Format salary information
         salary_info = None
-        if job.get('salary'):
-            if isinstance(job['salary'], dict):
+        if salary:
+            if isinstance(salary, dict):
                 salary_info = {
-                    'currency': job['salary'].get('currency', ''),
-                    'tenure': job['salary'].get('tenure', ''),
-                    'min': job['salary'].get('min', ''),
-                    'max': job['salary'].get('max', ''),
-                    'display': job['salary'].get('display', '')
+                    'currency': salary.get('currency', ''),
+                    'tenure': salary.get('tenure', ''),
+                    'min': salary.get('min', ''),
+                    'max': salary.get('max', ''),
+                    'display': salary.get('display', '')
                 }
             else:
+                salary_display = safe_get_string(salary)
                 salary_info = {
                     'currency': '',
                     'tenure': '',
-                    'min': safe_get_string(job['salary']),
+                    'min': salary_display,
                     'max': '',
-                    'display': safe_get_string(job['salary'])
+                    'display': salary_display
                 }
         
         return {
@@ -347,8 +355,8 @@ class ResponseFormatter:
             'jobId': job.get('job_id', ''),
             'jobTitle': safe_get_string(job.get('job_title'), 'Job Title'),
             'company': company_info,
-            'locations': safe_get_list(job.get('locations')),
-            'location': safe_get_string(job.get('locations', [])[0] if job.get('locations') else job.get('location'), 'Location'),
+            'locations': safe_get_list(locations),
+            'location': safe_get_string(locations[0] if locations else job.get('location'), 'Location'),
             'experience': experience_info,
             'salary': salary_info,
             'skills': safe_get_list(job.get('skills')),